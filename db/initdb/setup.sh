@@ -12,9 +12,12 @@ psql -v ON_ERROR_STOP=1 --username "$POSTGRES_USER" --dbname "$POSTGRES_DB" <<-E
   CREATE TABLE IF NOT EXISTS portfolio_embeddings (
     id SERIAL PRIMARY KEY,
     content TEXT NOT NULL,
-    embedding VECTOR(1536) NOT NULL
+    embedding HALFVEC(768) NOT NULL
   );
 
+  CREATE INDEX IF NOT EXISTS portfolio_embeddings_hnsw ON portfolio_embeddings
+    USING hnsw (embedding halfvec_ip_ops) WITH (m = 16, ef_construction = 64);
+
   GRANT ALL PRIVILEGES ON DATABASE "personal-ai" TO apiuser;
 
 EOSQL
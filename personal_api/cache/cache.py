@@ -0,0 +1,125 @@
+import os
+import hashlib
+import logging
+from collections import OrderedDict
+from typing import Optional
+from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+redis_client: Optional[Redis] = None
+
+# Default time-to-live for entries stored in Redis (24 hours)
+DEFAULT_TTL = 86400
+# Seconds to wait on Redis before treating the lookup as a miss, so a hung or
+# unreachable Redis can't stall requests
+REDIS_TIMEOUT = 0.25
+
+
+class LRUCache:
+    """
+    Small in-process least-recently-used cache for byte values.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[str, bytes]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[bytes]:
+        value = self._data.get(key)
+        if value is not None:
+            self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: bytes) -> None:
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+
+local_cache = LRUCache(maxsize=int(os.getenv("LOCAL_CACHE_SIZE", "1024")))
+
+
+def make_key(prefix: str, *parts: str) -> str:
+    """
+    Build a cache key from a prefix and the SHA-256 hash of the given parts.
+    """
+    digest = hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+    return f"{prefix}:{digest}"
+
+
+async def init_redis() -> None:
+    """
+    Initialize the Redis client if REDIS_URL is configured. Without it only the
+    in-process cache is used.
+    """
+    global redis_client
+    redis_url = os.getenv("REDIS_URL")
+    if not redis_url:
+        logger.info("REDIS_URL not set, using in-process cache only.")
+        return
+    try:
+        logger.info("Initializing Redis client...")
+        redis_client = Redis.from_url(
+            redis_url,
+            socket_connect_timeout=REDIS_TIMEOUT,
+            socket_timeout=REDIS_TIMEOUT,
+        )
+        await redis_client.ping()
+        logger.info("Redis client created successfully.")
+    except Exception as e:
+        logger.error(f"Error connecting to Redis, using in-process cache only: {e}")
+        redis_client = None
+
+
+async def close_redis() -> None:
+    """
+    Close the Redis client.
+    """
+    global redis_client
+    if redis_client is not None:
+        try:
+            logger.info("Closing Redis client...")
+            await redis_client.aclose()
+            logger.info("Redis client closed successfully.")
+        except Exception as e:
+            logger.error(f"Error closing Redis client: {e}")
+        finally:
+            redis_client = None
+
+
+async def cache_get(key: str) -> Optional[bytes]:
+    """
+    Look up a key in the in-process cache, falling back to Redis.
+
+    Returns
+    -------
+    Optional[bytes]
+        The cached value, or None on a miss.
+    """
+    value = local_cache.get(key)
+    if value is not None:
+        return value
+    if redis_client is None:
+        return None
+    try:
+        value = await redis_client.get(key)
+    except Exception as e:
+        logger.warning(f"Redis GET failed for {key}: {e}")
+        return None
+    if value is not None:
+        local_cache.set(key, value)
+    return value
+
+
+async def cache_set(key: str, value: bytes, ttl: int = DEFAULT_TTL) -> None:
+    """
+    Store a value in the in-process cache and, if configured, in Redis.
+    """
+    local_cache.set(key, value)
+    if redis_client is None:
+        return
+    try:
+        await redis_client.set(key, value, ex=ttl)
+    except Exception as e:
+        logger.warning(f"Redis SET failed for {key}: {e}")
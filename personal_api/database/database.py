@@ -7,6 +7,14 @@ from pgvector.asyncpg import register_vector
 logger = logging.getLogger(__name__)
 conn_pool: Optional[asyncpg.Pool] = None
 
+# Each gunicorn worker creates its own pool, so keep
+# PG_POOL_MAX_SIZE * GUNICORN_WORKERS below Postgres max_connections - 10
+PG_POOL_MIN_SIZE = int(os.getenv("PG_POOL_MIN_SIZE", "5"))
+PG_POOL_MAX_SIZE = int(os.getenv("PG_POOL_MAX_SIZE", "20"))
+PG_COMMAND_TIMEOUT = float(os.getenv("PG_COMMAND_TIMEOUT", "30"))
+# HNSW candidate list size for similarity search (pgvector default is 40)
+HNSW_EF_SEARCH = int(os.getenv("HNSW_EF_SEARCH", "40"))
+
 
 async def init_postgres() -> None:
     """
@@ -16,14 +24,24 @@ async def init_postgres() -> None:
     try:
         logger.info("Initializing PostgreSQL connection pool...")
 
+        # Runs once per new connection: register_vector installs pgvector's
+        # binary codecs, so embeddings can be passed as plain lists without a
+        # text round-trip
         async def initalize_vector(conn):
             await register_vector(conn)
 
         conn_pool = await asyncpg.create_pool(
             dsn=os.getenv("DATABASE_URL"),
             init=initalize_vector,
-            min_size=2,
-            max_size=5
+            min_size=PG_POOL_MIN_SIZE,
+            max_size=PG_POOL_MAX_SIZE,
+            command_timeout=PG_COMMAND_TIMEOUT,
+            # Reuse prepared statements per connection instead of re-parsing
+            statement_cache_size=1024,
+            max_inactive_connection_lifetime=300,
+            # Applied at connection startup, so it survives the RESET ALL
+            # asyncpg runs when a connection is released back to the pool
+            server_settings={"hnsw.ef_search": str(HNSW_EF_SEARCH)},
         )
         logger.info("PostgreSQL connection pool created successfully.")
 
@@ -7,14 +7,17 @@ bind = "0.0.0.0:8000"
 backlog = 2048
 
 # Worker processes
-workers = int(os.getenv("GUNICORN_WORKERS", multiprocessing.cpu_count() * 2 + 1))
-worker_class = "uvicorn.workers.UvicornWorker"
-worker_connections = 1000
+# Each async worker multiplexes many concurrent requests on its event loop, so
+# one per core is enough; the WSGI "2 * cores + 1" rule only wastes memory.
+# Every worker opens its own PostgreSQL pool, so keep
+# workers * pool max_size (database/database.py) below Postgres max_connections.
+workers = int(os.getenv("GUNICORN_WORKERS", max(2, multiprocessing.cpu_count())))
+worker_class = "gunicorn_worker.FastUvicornWorker"  # UvicornWorker using uvloop + httptools
 max_requests = 1000
 max_requests_jitter = 50
 timeout = 120
 graceful_timeout = 30
-keepalive = 5
+keepalive = 30  # Behind nginx, keep idle proxy connections open
 
 # Logging
 accesslog = os.getenv("GUNICORN_ACCESS_LOG", "-")  # - means stdout
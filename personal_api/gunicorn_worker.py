@@ -0,0 +1,11 @@
+"""Gunicorn worker class for the Personal Website API"""
+from uvicorn.workers import UvicornWorker
+
+
+class FastUvicornWorker(UvicornWorker):
+    """
+    Uvicorn worker pinned to the uvloop event loop and httptools HTTP parser.
+    The default "auto" settings silently fall back to asyncio/h11 when these
+    are missing; pinning them makes a broken install fail at startup instead.
+    """
+    CONFIG_KWARGS = {"loop": "uvloop", "http": "httptools", "lifespan": "on"}
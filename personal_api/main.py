@@ -9,15 +9,24 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from database.database import init_postgres, close_postgres
+from cache.cache import init_redis, close_redis
 from routes.route import router
 import uvicorn
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 
 # Configure logging
 def setup_logging():
-    """Configure logging with file output and configurable log level."""
+    """
+    Configure logging with file output and configurable log level.
+
+    Records are put on a queue and written by a QueueListener thread, so request
+    handlers never block on file or console I/O. Returns the module logger and
+    the listener, which must be stopped on shutdown to flush pending records.
+    """
     # Get log level from environment variable, default to INFO
     log_level = os.getenv("LOG_LEVEL", "INFO").upper()
 
@@ -30,8 +39,9 @@ def setup_logging():
         datefmt='%Y-%m-%d %H:%M:%S'
     )
 
-    # File handler
-    file_handler = logging.FileHandler(log_file)
+    # File handler (opened on first write). Every gunicorn worker appends to the
+    # same file, so rotation is left to an external tool such as logrotate.
+    file_handler = logging.FileHandler(log_file, delay=True)
     file_handler.setLevel(getattr(logging, log_level))
     file_handler.setFormatter(formatter)
 
@@ -40,17 +50,22 @@ def setup_logging():
     console_handler.setLevel(getattr(logging, log_level))
     console_handler.setFormatter(formatter)
 
+    # Queue handler; the listener thread hands records to the real handlers
+    log_queue = queue.Queue(-1)
+    queue_handler = QueueHandler(log_queue)
+    listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    listener.start()
+
     # Configure root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(getattr(logging, log_level))
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(console_handler)
+    root_logger.addHandler(queue_handler)
 
-    return logging.getLogger(__name__)
+    return logging.getLogger(__name__), listener
 
 
 # Initialize logging
-logger = setup_logging()
+logger, log_listener = setup_logging()
 
 
 @asynccontextmanager
@@ -64,24 +79,32 @@ async def lifespan(app: FastAPI):
     await init_postgres()
     logger.info("PostgreSQL connection pool initialized successfully")
 
+    await init_redis()
+
     logger.info("Application startup complete")
     yield
 
     logger.info("Shutting down application")
     await close_postgres()
     logger.info("PostgreSQL connection pool closed")
+    await close_redis()
     logger.info("Application shutdown complete")
+    log_listener.stop()
 
 
 app: FastAPI = FastAPI(lifespan=lifespan, title="FastAPI Portfolio RAG ChatBot API")
 app.include_router(router)
 
+# Only the site's own origins may call the API; browsers cache preflight
+# responses for max_age seconds instead of repeating them per request
+cors_origins = os.getenv("CORS_ORIGINS", "https://daveywalbeck.com,https://www.daveywalbeck.com")
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=[origin.strip() for origin in cors_origins.split(",") if origin.strip()],
+    allow_methods=["GET", "POST"],
+    allow_headers=["Content-Type", "Authorization"],
+    max_age=86400,
 )
 
 #def main():
@@ -6,6 +6,10 @@ class PortfolioEntryCreate(BaseModel):
     content: str
 
 
+class PortfolioEntryBatchCreate(BaseModel):
+    entries: list[PortfolioEntryCreate]
+
+
 class PortfolioEntryResponse(BaseModel):
     id: int
     content: str
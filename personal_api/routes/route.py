@@ -1,13 +1,30 @@
-from fastapi import APIRouter, HTTPException, Depends, UploadFile, File
-from models.model import PortfolioEntryCreate, PortfolioEntryResponse, QueryRequest, ContactRequest
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Depends, UploadFile, File
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from models.model import (
+    PortfolioEntryCreate,
+    PortfolioEntryBatchCreate,
+    PortfolioEntryResponse,
+    QueryRequest,
+    ContactRequest,
+)
 from database.database import get_postgres
+from cache.cache import make_key, cache_get, cache_set
 import asyncpg
-from typing import List
+from typing import AsyncIterator, List
 import os
-from openai import OpenAI
+import io
+import codecs
+import asyncio
+from openai import (
+    AsyncOpenAI,
+    APIConnectionError,
+    APITimeoutError,
+    InternalServerError,
+    RateLimitError,
+)
 import numpy as np
 import logging
-import smtplib
+import aiosmtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 
@@ -15,29 +32,226 @@ router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
+EMBEDDING_MODEL = "text-embedding-3-small"
+# text-embedding-3 models can return shortened embeddings; 768 dimensions
+# stored as halfvec cuts storage and scan bandwidth ~4x versus 1536 float32
+EMBEDDING_DIMENSIONS = 768
+CHAT_MODEL = "gpt-4o-mini"
+# Retrieved rows further than this cosine distance from the query are left out
+# of the prompt, and each row is truncated to CONTEXT_MAX_CHARS. The closest row
+# is always kept so the model has some context to work with.
+CONTEXT_MAX_DISTANCE = 0.6
+CONTEXT_MAX_CHARS = 500
+
+# OpenAI accepts up to 2048 inputs per embeddings request, but keeping batches
+# small keeps each request well under the per-request token budget.
+EMBEDDING_BATCH_SIZE = 96
+# Cap on the combined size of one batch, keeping each request below the 300k
+# token per-request limit even for text that encodes at ~1 token per character.
+EMBEDDING_BATCH_CHARS = 250_000
+# Max embedding requests in flight at once for a single ingest
+EMBEDDING_CONCURRENCY = 5
+EMBEDDING_MAX_RETRIES = 3
+# text-embedding-3-small accepts at most 8191 tokens per input. A character is
+# never more than one token in practice (CJK, code and base64 come closest), so
+# chunks of this many characters stay under the limit for any text.
+FILE_CHUNK_CHARS = 8_000
+# Uploads are read in blocks of this size and rejected above MAX_UPLOAD_BYTES
+UPLOAD_READ_SIZE = 65536
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_BYTES", str(10 * 1024 * 1024)))
+
+# Kept as a constant, byte-identical on every request, at the start of the
+# messages so OpenAI's automatic prompt caching can reuse the shared prefix
+SYSTEM_PROMPT = (
+    "You are YOUR NAME, and you are answering questions as yourself, using 'I' and 'my' in your responses. "
+    "You should respond to questions about your portfolio, skills, experience, and education. For example, you should answer questions about specific technologies you've worked with, such as Java, React, or other tools. "
+    "If you have relevant experience with a technology, describe it concisely. For example, if asked about Java, describe your experience using it. "
+    "You should also answer questions about your education, including your experience at school, and your work in relevant industries. "
+    "However, if a question is completely unrelated to your professional experience, such as questions about recipes, trivia, or non-technical personal matters, respond with: 'That question isn't relevant to my experience or skills.' "
+    "Focus on answering technical and career-related questions, but only reject questions that are clearly off-topic."
+    "If they ask you about a technology you havent used, you can say: 'I haven't worked with that technology yet, but I'm always eager to learn new things.'"
+    "Answer any personal questions that are related to technology, like 'What are our favorite languages?' or 'What technology/language/anything tech are you most excited about?'"
+)
+
+# SQL statements are kept as module-level constants so every call sends the
+# identical text and hits asyncpg's per-connection prepared statement cache
+INSERT_ENTRY_SQL = """
+INSERT INTO portfolio_embeddings (content, embedding)
+VALUES ($1, $2)
+RETURNING id, content, embedding
+"""
 
-client = OpenAI(
+INSERT_ENTRIES_SQL = """
+INSERT INTO portfolio_embeddings (content, embedding)
+VALUES ($1, $2)
+"""
+
+# Embeddings are stored unit length, so negative inner product (<#>) orders
+# rows the same as cosine distance without the per-row normalization;
+# 1 + (a <#> b) is the cosine distance between unit vectors
+SEARCH_SIMILAR_SQL = """
+SELECT content, 1 + (embedding <#> $1) AS similarity
+FROM portfolio_embeddings
+ORDER BY embedding <#> $1
+LIMIT 5
+"""
+
+client = AsyncOpenAI(
     api_key=os.getenv("OPENAI_API_KEY"),
     organization=os.getenv("OPENAI_ORG_ID"),
     project=os.getenv("OPENAI_PROJECT_ID"),
 )
 
 
-async def generate_embedding(content: str) -> List[float]:
+async def read_upload_text(file: UploadFile, max_bytes: int = MAX_UPLOAD_BYTES) -> str:
     """
-    Generate an embedding for the given content using OpenAI API.
+    Read an uploaded file as UTF-8 text in fixed-size blocks, decoding as it
+    goes so the raw bytes are never held in memory all at once.
+    Raises UnicodeDecodeError on invalid UTF-8 and a 413 HTTPException when
+    the upload exceeds max_bytes.
+    """
+    # Reject on the reported size before decoding anything; the read loop
+    # below still enforces the limit when the size isn't known
+    if file.size is not None and file.size > max_bytes:
+        raise HTTPException(
+            status_code=413, detail=f"File exceeds the {max_bytes} byte upload limit."
+        )
+
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="strict")
+    buffer = io.StringIO()
+    total = 0
+    while chunk := await file.read(UPLOAD_READ_SIZE):
+        total += len(chunk)
+        if total > max_bytes:
+            raise HTTPException(
+                status_code=413, detail=f"File exceeds the {max_bytes} byte upload limit."
+            )
+        buffer.write(decoder.decode(chunk))
+    buffer.write(decoder.decode(b"", final=True))
+    return buffer.getvalue()
+
+
+def split_text(content: str, max_chars: int = FILE_CHUNK_CHARS) -> List[str]:
+    """
+    Split text into chunks of at most max_chars, preferring to break on a
+    newline or space so words aren't cut in half.
+    """
+    chunks: List[str] = []
+    start = 0
+    while len(content) - start > max_chars:
+        end = start + max_chars
+        # Search from start + 1 so a separator at the very start can't produce
+        # an empty split and leave the next chunk cut mid-word
+        split_at = max(content.rfind("\n", start + 1, end), content.rfind(" ", start + 1, end))
+        if split_at <= start:
+            split_at = end
+        chunks.append(content[start:split_at])
+        start = split_at
+    chunks.append(content[start:])
+    return [chunk for chunk in chunks if chunk.strip()]
+
+
+def _batch_texts(texts: List[str]) -> List[List[str]]:
+    """
+    Group texts into batches bounded by EMBEDDING_BATCH_SIZE inputs and
+    EMBEDDING_BATCH_CHARS total characters.
+    """
+    batches: List[List[str]] = []
+    batch: List[str] = []
+    batch_chars = 0
+    for text in texts:
+        if batch and (len(batch) >= EMBEDDING_BATCH_SIZE or batch_chars + len(text) > EMBEDDING_BATCH_CHARS):
+            batches.append(batch)
+            batch = []
+            batch_chars = 0
+        batch.append(text)
+        batch_chars += len(text)
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+async def _embed_batch(sem: asyncio.Semaphore, batch: List[str]) -> List[List[float]]:
+    """
+    Embed a single batch, retrying transient OpenAI errors with exponential backoff.
+    The SDK's own retries are disabled here so attempts don't multiply, and the
+    semaphore slot is released while waiting to retry.
+    """
+    for attempt in range(EMBEDDING_MAX_RETRIES + 1):
+        try:
+            async with sem:
+                response = await client.with_options(max_retries=0).embeddings.create(
+                    input=batch,
+                    model=EMBEDDING_MODEL,
+                    dimensions=EMBEDDING_DIMENSIONS,
+                )
+            # Results are returned with an index; don't rely on list order
+            return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+        except (APIConnectionError, APITimeoutError, InternalServerError, RateLimitError) as e:
+            if attempt == EMBEDDING_MAX_RETRIES:
+                raise
+            delay = 2 ** attempt
+            logger.warning("Embedding request failed (%s), retrying in %ss", e, delay)
+            await asyncio.sleep(delay)
+
+
+def normalize_embedding(embedding: List[float]) -> List[float]:
+    """
+    Scale an embedding to unit length so inner product equals cosine similarity.
+    """
+    vector = np.asarray(embedding, dtype=np.float32)
+    norm = np.linalg.norm(vector)
+    if norm > 0:
+        vector /= norm
+    return vector.tolist()
+
+
+async def generate_embeddings(texts: List[str]) -> List[List[float]]:
+    """
+    Generate embeddings for a list of texts using the OpenAI API. Texts are
+    grouped into batches which are sent concurrently (up to
+    EMBEDDING_CONCURRENCY at a time); results keep the order of the input and
+    are normalized to unit length.
     """
     try:
-        content = content.replace("\n", " ")
-        response = client.embeddings.create(
-            input=[content],
-            model="text-embedding-3-small",
+        texts = [text.replace("\n", " ") for text in texts]
+        sem = asyncio.Semaphore(EMBEDDING_CONCURRENCY)
+        results = await asyncio.gather(
+            *[_embed_batch(sem, batch) for batch in _batch_texts(texts)]
         )
-        return response.data[0].embedding
+        return [normalize_embedding(embedding) for batch in results for embedding in batch]
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating embedding: {e}")
 
 
+async def generate_embedding(content: str) -> List[float]:
+    """
+    Generate an embedding for the given content using OpenAI API.
+    """
+    return (await generate_embeddings([content]))[0]
+
+
+async def get_query_embedding(query: str) -> List[float]:
+    """
+    Return the embedding for a chat query, served from the in-process/Redis
+    cache when the same (normalized) query has been embedded before.
+    """
+    # The normalized form is only used for the cache key; the query itself is
+    # embedded as written so retrieval isn't changed by the cache
+    normalized = " ".join(query.lower().split())
+    # Keys are partitioned by model and dimension so a model change never
+    # returns vectors of the wrong shape
+    key = make_key(f"emb:{EMBEDDING_MODEL}:{EMBEDDING_DIMENSIONS}", normalized)
+    cached = await cache_get(key)
+    if cached is not None:
+        logger.debug("Query embedding cache hit")
+        return np.frombuffer(cached, dtype=np.float32).tolist()
+
+    embedding = await generate_embedding(query)
+    await cache_set(key, np.asarray(embedding, dtype=np.float32).tobytes())
+    return embedding
+
+
 @router.post("/add-entry/", response_model=PortfolioEntryResponse)
 async def add_portfolio_entry(
     entry: PortfolioEntryCreate, pool: asyncpg.Pool = Depends(get_postgres)
@@ -46,29 +260,19 @@ async def add_portfolio_entry(
     Add a new portfolio entry and store its embedding in PostgreSQL.
     """
     logger.info("POST /add-entry/ - Request started")
-    logger.debug(f"POST /add-entry/ - Entry content length: {len(entry.content)} characters")
+    logger.debug("POST /add-entry/ - Entry content length: %s characters", len(entry.content))
 
     try:
         logger.debug("Generating embedding for entry content")
         embedding = await generate_embedding(entry.content)
 
-        embedding_np = np.array(embedding)
-
         logger.debug("Inserting entry into database")
         async with pool.acquire() as conn:
-            row = await conn.fetchrow(
-                """
-                INSERT INTO portfolio_embeddings (content, embedding)
-                VALUES ($1, $2)
-                RETURNING id, content, embedding
-                """,
-                entry.content,
-                embedding_np,
-            )
+            row = await conn.fetchrow(INSERT_ENTRY_SQL, entry.content, embedding)
             if row:
-                logger.info(f"POST /add-entry/ - Request completed successfully (entry_id: {row['id']})")
+                logger.info("POST /add-entry/ - Request completed successfully (entry_id: %s)", row['id'])
                 return PortfolioEntryResponse(
-                    id=row["id"], content=row["content"], embedding=row["embedding"]
+                    id=row["id"], content=row["content"], embedding=row["embedding"].to_list()
                 )
             else:
                 logger.error("POST /add-entry/ - Failed to insert entry into database")
@@ -78,141 +282,233 @@ async def add_portfolio_entry(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"POST /add-entry/ - Request failed with error: {str(e)}")
+        logger.error("POST /add-entry/ - Request failed with error: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to add entry: {e}")
 
 
-@router.post("/add-file", response_model=PortfolioEntryResponse)
+@router.post("/add-entries-batch")
+async def add_portfolio_entries_batch(
+    batch: PortfolioEntryBatchCreate, pool: asyncpg.Pool = Depends(get_postgres)
+):
+    """
+    Add multiple portfolio entries at once, generating their embeddings in
+    batched OpenAI requests and inserting them in a single transaction.
+    """
+    logger.info("POST /add-entries-batch - Request started")
+    logger.debug("POST /add-entries-batch - Entry count: %s", len(batch.entries))
+
+    if not batch.entries:
+        raise HTTPException(status_code=400, detail="No entries provided.")
+
+    try:
+        contents = [entry.content for entry in batch.entries]
+
+        logger.debug("Generating embeddings for entry contents")
+        embeddings = await generate_embeddings(contents)
+
+        logger.debug("Inserting entries into database")
+        async with pool.acquire() as conn:
+            async with conn.transaction():
+                await conn.executemany(INSERT_ENTRIES_SQL, list(zip(contents, embeddings)))
+
+        logger.info("POST /add-entries-batch - Request completed successfully (%s entries)", len(contents))
+        return {"status": "success", "count": len(contents)}
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("POST /add-entries-batch - Request failed with error: %s", e)
+        raise HTTPException(status_code=500, detail=f"Failed to add entries: {e}")
+
+
+@router.post("/add-file", response_model=List[PortfolioEntryResponse])
 async def add_portfolio_file(
     file: UploadFile = File(...), pool: asyncpg.Pool = Depends(get_postgres)
 ):
     """
-    Add a new portfolio entry from an uploaded file and store its embedding in PostgreSQL.
+    Add portfolio entries from an uploaded file and store their embeddings in PostgreSQL.
+    Files larger than FILE_CHUNK_CHARS are split into multiple entries.
     """
     logger.info("POST /add-file - Request started")
-    logger.debug(f"POST /add-file - File name: {file.filename}, Content type: {file.content_type}")
+    logger.debug("POST /add-file - File name: %s, Content type: %s", file.filename, file.content_type)
 
     try:
         # Read file contents
         logger.debug("Reading file contents")
-        file_contents = await file.read()
-        content = file_contents.decode('utf-8')
+        content = await read_upload_text(file)
 
-        logger.debug(f"POST /add-file - File content length: {len(content)} characters")
+        logger.debug("POST /add-file - File content length: %s characters", len(content))
 
-        # Generate embedding for the file content
-        logger.debug("Generating embedding for file content")
-        embedding = await generate_embedding(content)
+        chunks = split_text(content)
+        if not chunks:
+            raise HTTPException(status_code=400, detail="File is empty.")
 
-        embedding_np = np.array(embedding)
+        # Generate embeddings for the file content
+        logger.debug("Generating embeddings for %s file chunk(s)", len(chunks))
+        embeddings = await generate_embeddings(chunks)
 
-        # Insert entry into database
-        logger.debug("Inserting entry into database")
+        # Insert entries into database
+        logger.debug("Inserting entries into database")
+        entries: List[PortfolioEntryResponse] = []
         async with pool.acquire() as conn:
-            row = await conn.fetchrow(
-                """
-                INSERT INTO portfolio_embeddings (content, embedding)
-                VALUES ($1, $2)
-                RETURNING id, content, embedding
-                """,
-                content,
-                embedding_np,
-            )
-            if row:
-                logger.info(f"POST /add-file - Request completed successfully (entry_id: {row['id']})")
-                return PortfolioEntryResponse(
-                    id=row["id"], content=row["content"], embedding=row["embedding"]
-                )
-            else:
-                logger.error("POST /add-file - Failed to insert entry into database")
-                raise HTTPException(
-                    status_code=500, detail="Failed to insert entry into the database."
-                )
+            async with conn.transaction():
+                insert_stmt = await conn.prepare(INSERT_ENTRY_SQL)
+                for chunk, embedding in zip(chunks, embeddings):
+                    row = await insert_stmt.fetchrow(chunk, embedding)
+                    if not row:
+                        logger.error("POST /add-file - Failed to insert entry into database")
+                        raise HTTPException(
+                            status_code=500, detail="Failed to insert entry into the database."
+                        )
+                    entries.append(
+                        PortfolioEntryResponse(
+                            id=row["id"], content=row["content"], embedding=row["embedding"].to_list()
+                        )
+                    )
+
+        logger.info("POST /add-file - Request completed successfully (%s entries)", len(entries))
+        return entries
     except UnicodeDecodeError as e:
-        logger.error(f"POST /add-file - File encoding error: {str(e)}")
+        logger.error("POST /add-file - File encoding error: %s", e)
         raise HTTPException(
             status_code=400, detail="File must be a valid UTF-8 text file."
         )
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"POST /add-file - Request failed with error: {str(e)}")
+        logger.error("POST /add-file - Request failed with error: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to add file: {e}")
 
 
+# Tells an nginx reverse proxy not to buffer the streamed reply
+STREAM_HEADERS = {"X-Accel-Buffering": "no", "Cache-Control": "no-cache"}
+
+
 @router.post("/chat/")
 async def chat(query: QueryRequest, pool: asyncpg.Pool = Depends(get_postgres)):
     """
     Chat with the portfolio chatbot by retrieving relevant information from stored embeddings
-    and using it as context to generate a response.
+    and using it as context to generate a response. The response is streamed back as
+    plain text as tokens are generated.
     """
     logger.info("POST /chat/ - Request started")
-    logger.debug(f"POST /chat/ - Query: {query.query[:100]}...")  # Log first 100 chars
+    logger.debug("POST /chat/ - Query: %s...", query.query[:100])  # Log first 100 chars
 
     try:
+        # The embedding is awaited before acquiring a connection: acquiring an
+        # idle pooled connection is nearly free, while holding one across the
+        # OpenAI call would let slow embeddings exhaust the pool
         logger.debug("Generating embedding for query")
-        query_embedding = await generate_embedding(query.query)
-
-        query_embedding_np = np.array(query_embedding)
+        query_embedding = await get_query_embedding(query.query)
 
         logger.debug("Fetching similar portfolio entries from database")
         async with pool.acquire() as conn:
-            rows = await conn.fetch(
-                """
-                SELECT content, embedding <=> $1 AS similarity
-                FROM portfolio_embeddings
-                ORDER BY similarity
-                LIMIT 5
-                """,
-                query_embedding_np,
-            )
+            # Ordering by the distance expression lets the planner use the HNSW index
+            rows = await conn.fetch(SEARCH_SIMILAR_SQL, query_embedding)
 
-            logger.debug(f"Found {len(rows)} relevant portfolio entries")
-            context = "\n".join([row["content"] for row in rows])
+        logger.debug("Found %s relevant portfolio entries", len(rows))
+        relevant = [row for row in rows if row["similarity"] < CONTEXT_MAX_DISTANCE] or rows[:1]
+        context = "\n".join([row["content"][:CONTEXT_MAX_CHARS] for row in relevant])
+
+        # Identical questions answered from identical context get the same reply
+        completion_key = make_key(f"chat:{CHAT_MODEL}", SYSTEM_PROMPT, query.query, context)
+        cached_response = await cache_get(completion_key)
+        if cached_response is not None:
+            logger.info("POST /chat/ - Request completed successfully (cached)")
+            return PlainTextResponse(cached_response.decode("utf-8"))
 
         logger.debug("Generating chat completion with OpenAI")
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
+        stream = await client.chat.completions.create(
+            model=CHAT_MODEL,
             messages=[
-                {
-                    "role": "system",
-                    "content": (
-                        "You are YOUR NAME, and you are answering questions as yourself, using 'I' and 'my' in your responses. "
-                        "You should respond to questions about your portfolio, skills, experience, and education. For example, you should answer questions about specific technologies you've worked with, such as Java, React, or other tools. "
-                        "If you have relevant experience with a technology, describe it concisely. For example, if asked about Java, describe your experience using it. "
-                        "You should also answer questions about your education, including your experience at school, and your work in relevant industries. "
-                        "However, if a question is completely unrelated to your professional experience, such as questions about recipes, trivia, or non-technical personal matters, respond with: 'That question isn't relevant to my experience or skills.' "
-                        "Focus on answering technical and career-related questions, but only reject questions that are clearly off-topic."
-                        "If they ask you about a technology you havent used, you can say: 'I haven't worked with that technology yet, but I'm always eager to learn new things.'"
-                        "Answer any personal questions that are related to technology, like 'What are our favorite languages?' or 'What technology/language/anything tech are you most excited about?'"
-                    ),
-                },
+                {"role": "system", "content": SYSTEM_PROMPT},
                 {
                     "role": "user",
                     "content": f"Context: {context}\n\nQuestion: {query.query}",
                 },
             ],
             max_tokens=200,
-            stream=False,
+            temperature=0.3,
+            stream=True,
+            stream_options={"include_usage": True},
         )
 
-        logger.info("POST /chat/ - Request completed successfully")
-        return {"response": response.choices[0].message.content}
+        async def generate_response() -> AsyncIterator[str]:
+            parts: List[str] = []
+            try:
+                async for chunk in stream:
+                    if chunk.usage and logger.isEnabledFor(logging.DEBUG):
+                        details = chunk.usage.prompt_tokens_details
+                        cached_tokens = details.cached_tokens if details else 0
+                        logger.debug("Prompt tokens: %s (%s cached)", chunk.usage.prompt_tokens, cached_tokens)
+                    if not chunk.choices:
+                        continue
+                    delta = chunk.choices[0].delta.content
+                    if delta:
+                        parts.append(delta)
+                        yield delta
+            except Exception as e:
+                # Headers are already sent, so the error can only be logged
+                logger.error("POST /chat/ - Streaming failed with error: %s", e)
+                return
+            finally:
+                # Release the HTTP connection even if the client disconnects
+                # and the generator is abandoned part way through
+                await stream.close()
+
+            content = "".join(parts)
+            if content:
+                await cache_set(completion_key, content.encode("utf-8"))
+            logger.info("POST /chat/ - Request completed successfully")
+
+        return StreamingResponse(
+            generate_response(), media_type="text/plain; charset=utf-8", headers=STREAM_HEADERS
+        )
 
     except Exception as e:
-        logger.error(f"POST /chat/ - Request failed with error: {str(e)}")
+        logger.error("POST /chat/ - Request failed with error: %s", e)
         raise HTTPException(
             status_code=500, detail=f"Failed to process chat request: {e}"
         )
 
 
+async def send_email(
+    msg: MIMEMultipart, smtp_host: str, smtp_port: int, smtp_user: str, smtp_password: str
+) -> None:
+    """
+    Send an email message over SMTP. Runs as a background task, so failures are
+    logged rather than raised.
+    """
+    try:
+        # STARTTLS and login are only used when credentials are configured
+        use_auth = bool(smtp_user and smtp_password)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Sending via %s:%s (STARTTLS and login: %s)", smtp_host, smtp_port, use_auth)
+        errors, response = await aiosmtplib.send(
+            msg,
+            hostname=smtp_host,
+            port=smtp_port,
+            username=smtp_user if use_auth else None,
+            password=smtp_password if use_auth else None,
+            start_tls=use_auth,
+        )
+        # aiosmtplib does no logging of its own; report the server's reply and
+        # any rejected recipients when debugging delivery
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("SMTP server response: %s", response)
+            logger.debug("SMTP rejected recipients: %s", errors or "none")
+        logger.info("Contact email sent successfully")
+    except Exception as e:
+        logger.error("Failed to send contact email: %s", e)
+
+
 @router.post("/contact/")
-async def contact(contact_data: ContactRequest):
+async def contact(contact_data: ContactRequest, background: BackgroundTasks):
     """
-    Handle contact form submission and send email.
+    Handle contact form submission and queue the email to be sent after the
+    response is returned.
     """
     logger.info("POST /contact/ - Request started")
-    logger.debug(f"POST /contact/ - From: {contact_data.firstName} {contact_data.lastName} ({contact_data.email})")
+    logger.debug("POST /contact/ - From: %s %s (%s)", contact_data.firstName, contact_data.lastName, contact_data.email)
 
     try:
         # Create email message
@@ -245,28 +541,20 @@ Message:
         if smtp_password:
             smtp_password = smtp_password.replace(" ", "").replace("\n", "").replace("\r", "").strip()
 
-        logger.debug(f"Sending email via SMTP server: {smtp_host}:{smtp_port}")
-        logger.debug(f"SMTP user: {smtp_user}")
-        logger.debug(f"SMTP password length: {len(smtp_password)} characters")
-        logger.debug(f"SMTP password (masked): {'*' * min(len(smtp_password), 16)}")
-
-        # Send email
-        with smtplib.SMTP(smtp_host, smtp_port) as server:
-            server.set_debuglevel(1)  # Enable SMTP debug output
-            if smtp_user and smtp_password:
-                logger.debug("Starting TLS...")
-                server.starttls()
-                logger.debug(f"Attempting login with user: {smtp_user}")
-                server.login(smtp_user, smtp_password)
-                logger.debug("Login successful")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Sending email via SMTP server: %s:%s", smtp_host, smtp_port)
+            logger.debug("SMTP user: %s", smtp_user)
+            logger.debug("SMTP password length: %s characters", len(smtp_password))
+            logger.debug("SMTP password (masked): %s", '*' * min(len(smtp_password), 16))
 
-            server.send_message(msg)
+        # Send email once the response has gone out
+        background.add_task(send_email, msg, smtp_host, smtp_port, smtp_user, smtp_password)
 
-        logger.info("POST /contact/ - Email sent successfully")
-        return {"status": "success", "message": "Contact form submitted successfully"}
+        logger.info("POST /contact/ - Email queued successfully")
+        return {"status": "queued", "message": "Contact form submitted successfully"}
 
     except Exception as e:
-        logger.error(f"POST /contact/ - Request failed with error: {str(e)}")
+        logger.error("POST /contact/ - Request failed with error: %s", e)
         raise HTTPException(
-            status_code=500, detail=f"Failed to send contact email: {e}"
+            status_code=500, detail=f"Failed to queue contact email: {e}"
         )
@@ -1,5 +1,4 @@
 import React, { useState, useEffect, useRef } from 'react';
-import axios from 'axios';
 import config from '../../config/env';
 import TalkingHead from './TalkingHead';
 
@@ -51,26 +50,60 @@ const ChatBot: React.FC = () => {
   };
 
   const sendMessage = async () => {
-    if (message.trim() === '') return;
+    // Enter bypasses the disabled send button, so guard against sending while a reply streams
+    if (loading || message.trim() === '') return;
+
+    const query = message;
+    // The user's message and the bot's reply are the next two entries in the log
+    const botIndex = chatLog.length + 1;
+    let botAdded = false;
 
     setLoading(true);
-    setChatLog((prevLog) => [...prevLog, { sender: 'You', text: message }]);
+    setMessage('');
+    setChatLog((prevLog) => [...prevLog, { sender: 'You', text: query }]);
 
     try {
-      const response = await axios.post(`${config.apiUrl}/chat/`, {
-        query: message,
+      const response = await fetch(`${config.apiUrl}/chat/`, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ query }),
       });
 
-      if (response.data.response) {
-        setChatLog((prevLog) => [...prevLog, { sender: 'Bot', text: response.data.response }]);
+      if (!response.ok || !response.body) {
+        throw new Error(`Chat request failed with status ${response.status}`);
+      }
+
+      // The reply is streamed as plain text; grow the bot message as chunks arrive
+      setChatLog((prevLog) => [...prevLog, { sender: 'Bot', text: '' }]);
+      botAdded = true;
+      const reader = response.body.getReader();
+      const decoder = new TextDecoder();
+      let reply = '';
+
+      while (true) {
+        const { done, value } = await reader.read();
+        if (done) break;
+        reply += decoder.decode(value, { stream: true });
+        const text = reply;
+        setChatLog((prevLog) =>
+          prevLog.map((msg, index) => (index === botIndex ? { ...msg, text } : msg))
+        );
+      }
 
-        const duration = response.data.response.length * 50;
+      if (reply) {
+        const duration = reply.length * 50;
         setTalkingDuration(duration);
         setIsTalking(true);
         setTimeout(() => setIsTalking(false), duration);
       }
     } catch (error) {
-      setChatLog((prevLog) => [...prevLog, { sender: 'Bot', text: 'Something went wrong. Please try again later.' }]);
+      const errorMessage = { sender: 'Bot', text: 'Something went wrong. Please try again later.' };
+      // Replace the partially streamed reply if there is one, rather than adding a second bubble
+      setChatLog((prevLog) =>
+        botAdded
+          ? prevLog.map((msg, index) => (index === botIndex ? errorMessage : msg))
+          : [...prevLog, errorMessage]
+      );
 
       const duration = 2000;
       setTalkingDuration(duration);
@@ -78,7 +111,6 @@ const ChatBot: React.FC = () => {
       setTimeout(() => setIsTalking(false), duration);
     }
 
-    setMessage('');
     setLoading(false);
   };
 